@@ -1,15 +1,21 @@
 import os
-import shutil
+import sys
 import json
-from datetime import datetime
-from typing import Dict, List
-from tqdm import tqdm
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+_WRITTEN_REPORTS = frozenset({
+    'organization_history.txt',
+    'organization_summary.txt',
+    'organization_details.txt',
+    '.history_hash',
+})
+_REPORT_FILES = _WRITTEN_REPORTS | {'organization_timeline.txt'}
 
 class FileOrganizer:
     """A class to organize files by type or date into appropriate directories."""
     
     def __init__(self):
-        self.file_types: Dict[str, List[str]] = {
+        file_types: Dict[str, List[str]] = {
             'images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.heic', '.raw'],
             'documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.pages'],
             'spreadsheets': ['.xls', '.xlsx', '.numbers', '.csv'],
@@ -20,35 +26,59 @@ class FileOrganizer:
             'code': ['.py', '.java', '.cpp', '.js', '.html', '.css', '.php', '.c', '.ts'],
             'others': []
         }
+        self.file_types: Dict[str, FrozenSet[str]] = {
+            category: frozenset(sys.intern(ext) for ext in extensions)
+            for category, extensions in file_types.items()
+        }
+        self._ext_to_category: Dict[str, str] = {
+            ext: category
+            for category, extensions in self.file_types.items()
+            for ext in extensions
+        }
+        self._name_counters: Dict[Tuple[str, str], int] = {}
+        self._scanned_dirs: Set[str] = set()
+        self._claimed_paths: Set[str] = set()
         script_dir = os.path.dirname(__file__)
         self.history_file = os.path.join(script_dir, 'organization_history.json')
         self.timeline_file = os.path.join(script_dir, 'timeline.txt')
         self.history = []
         self.last_operation = None
+        self._timeline_buffer: List[str] = []
         self._load_history()
 
     def _load_history(self):
         """Load organization history from JSON file."""
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r') as f:
-                    self.history = json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    self.history = json.loads(f.read())
                     if self.history:
                         self.last_operation = self.history[-1]
         except Exception:
             self.history = []
             self.last_operation = None
 
+    def flush(self) -> None:
+        """Write pending timeline entries to disk."""
+        if not self._timeline_buffer:
+            return
+        # If file is empty or doesn't exist, add header
+        if not os.path.exists(self.timeline_file) or os.path.getsize(self.timeline_file) == 0:
+            self._timeline_buffer.insert(0, "Organization Timeline\n===================\n\n")
+        with open(self.timeline_file, 'a') as f:
+            f.write(''.join(self._timeline_buffer))
+        self._timeline_buffer.clear()
+
     def _save_history(self):
         """Save only the latest operation to history file."""
+        payload = json.dumps([self.last_operation] if self.last_operation else [], indent=2)
         with open(self.history_file, 'w') as f:
-            if self.last_operation:
-                json.dump([self.last_operation], f, indent=2)
-            else:
-                json.dump([], f, indent=2)
+            f.write(payload)
 
     def _record_operation(self, op_type: str, source_dir: str, target_dir: str, operations: list):
         """Record operation and update history files."""
+        from datetime import datetime
+
         operation = {
             'timestamp': datetime.now().isoformat(),
             'type': op_type,
@@ -61,114 +91,266 @@ class FileOrganizer:
             self.history = [operation]
             self.last_operation = operation
             self._save_history()
+            tree = list(self._iter_tree(target_dir))
+            reports = self._build_organization_history(tree)
+            reports.update(self._build_history(tree))
+            self._write_reports(target_dir, reports)
         
         self._update_timeline(operation)
 
     def organize_by_type(self, source_dir: str, dest_dir: str = None) -> None:
         """Organize files by type in source or destination directory."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
         if not os.path.exists(source_dir):
             raise FileNotFoundError(f"Source directory '{source_dir}' does not exist")
         target_dir = dest_dir if dest_dir else source_dir
         if not os.path.exists(target_dir):
             os.makedirs(target_dir)
-        files = [f for f in os.listdir(source_dir) if os.path.isfile(os.path.join(source_dir, f))]
+        # Reports from an earlier in-place run live alongside the files
+        in_place = os.path.abspath(target_dir) == os.path.abspath(source_dir)
+        skipped = _WRITTEN_REPORTS if in_place else ()
+        with os.scandir(source_dir) as it:
+            files = [
+                entry for entry in it
+                if entry.is_file(follow_symlinks=False) and entry.name not in skipped
+            ]
+        if self._same_device(source_dir, target_dir):
+            move = os.rename
+        else:
+            import shutil
+            move = shutil.move
+        self._name_counters.clear()
+        self._scanned_dirs.clear()
+        self._claimed_paths.clear()
+        splitext = os.path.splitext
+        lower = str.lower
+        ext_to_category = self._ext_to_category
+        category_dirs = {}
+        category_locks = {}
+        planned = []
+        # Create every category folder before any file moves, so a failure
+        # here cannot leave moved files unrecorded
+        for entry in files:
+            _, ext = splitext(entry.name)
+            category = ext_to_category.get(lower(ext), 'others')
+            if category not in category_dirs:
+                category_dir = os.path.join(target_dir, category)
+                os.makedirs(category_dir, exist_ok=True)
+                category_dirs[category] = category_dir
+                category_locks[category] = threading.Lock()
+            planned.append((entry, category))
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+            futures = [
+                executor.submit(
+                    self._move_file, entry, category_dirs[category], category_locks[category], move
+                )
+                for entry, category in planned
+            ]
+            for _ in self._progress(as_completed(futures), len(futures), "Organizing files"):
+                pass
         operations = []
-        for file in tqdm(files, desc="Organizing files"):
-            file_path = os.path.join(source_dir, file)
-            _, ext = os.path.splitext(file)
-            category = 'others'
-            for file_type, extensions in self.file_types.items():
-                if ext.lower() in extensions:
-                    category = file_type
-                    break
-            category_dir = os.path.join(target_dir, category)
-            os.makedirs(category_dir, exist_ok=True)
-            new_path = self._get_unique_path(os.path.join(category_dir, file))
-            shutil.move(file_path, new_path)
+        errors = []
+        # Destinations are always built by joining onto target_dir
+        target_len = len(os.path.join(target_dir, ''))
+        for entry, future in zip(files, futures):
+            try:
+                file_path, new_path = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
             operations.append({
                 'operation': 'move',
                 'source': file_path,
-                'destination': new_path
+                'destination': new_path,
+                'name': entry.name,
+                'relative_destination': new_path[target_len:]
             })
+        # Record the moves that succeeded so they can still be undone
         self._record_operation('organize_by_type', source_dir, target_dir, operations)
+        if errors:
+            raise errors[0]
+
+    def _progress(self, iterable, total: int, desc: str):
+        """Wrap iterable in a throttled progress bar, hidden when stderr is not a terminal."""
+        from tqdm import tqdm
+
+        return tqdm(
+            iterable,
+            total=total,
+            desc=desc,
+            mininterval=0.2,
+            miniters=max(1, total // 200),
+            disable=not (sys.stderr and sys.stderr.isatty()),
+        )
+
+    def _move_file(self, entry: os.DirEntry, category_dir: str, lock: 'threading.Lock', move) -> tuple:
+        """Move a single file into its category folder and return (source, destination)."""
+        with lock:
+            new_path = self._get_unique_path(os.path.join(category_dir, entry.name))
+            self._claimed_paths.add(new_path)
+        move(entry.path, new_path)
+        return entry.path, new_path
+
+    def _same_device(self, path_a: str, path_b: str) -> bool:
+        """Check whether two paths live on the same filesystem."""
+        try:
+            return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+        except OSError:
+            return False
 
     def _get_unique_path(self, file_path: str) -> str:
         """Generate unique file path if duplicate exists."""
-        if not os.path.exists(file_path):
+        claimed = self._claimed_paths
+        if file_path not in claimed and not os.path.exists(file_path):
             return file_path
+        folder, name = os.path.split(file_path)
+        if folder not in self._scanned_dirs:
+            self._scan_name_counters(folder)
         base, ext = os.path.splitext(file_path)
-        counter = 1
-        while os.path.exists(f"{base}_{counter}{ext}"):
-            counter += 1
-        return f"{base}_{counter}{ext}"
-
-    def _write_organization_history(self, target_dir: str) -> None:
-        """Write current folder structure to history file."""
-        history_file = os.path.join(target_dir, 'organization_history.txt')
-        
-        with open(history_file, 'w') as f:
-            f.write("Current Folder Structure\n")
-            f.write("=====================\n\n")
-            if self.history and self.history[-1]['type'] == 'undo':
-                f.write("Files restored to original location\n")
-                f.write(f"Time: {datetime.fromisoformat(self.history[-1]['timestamp']).strftime('%Y-%m-%d %I:%M %p')}\n")
-            else:
-                for root, dirs, files in os.walk(target_dir):
-                    level = root.replace(target_dir, '').count(os.sep)
-                    indent = '    ' * level
-                    folder = os.path.basename(root) or os.path.basename(target_dir)
-                    f.write(f"{indent}└── {folder}/\n")
-                    for file in files:
-                        if file != 'organization_history.txt':
-                            f.write(f"{indent}    ├── {file}\n")
-                    if files:
-                        f.write('\n')
-
-    def _write_history(self, target_dir: str) -> None:
-        """Write organization history with improved formatting."""
-        summary_file = os.path.join(target_dir, 'organization_summary.txt')
-        details_file = os.path.join(target_dir, 'organization_details.txt')
-        with open(summary_file, 'w') as f:
-            f.write("Organization Summary\n")
-            f.write("==================\n\n")
-            for entry in self.history:
-                f.write(f"Action: {entry['type'].replace('_', ' ').title()}\n")
-                f.write(f"When: {datetime.fromisoformat(entry['timestamp']).strftime('%Y-%m-%d %I:%M %p')}\n")
-                f.write(f"Source: {entry['source_dir']}\n")
-                f.write(f"Target: {entry['target_dir']}\n")
-                if entry['type'] != 'undo':
-                    f.write(f"Files Organized: {len(entry['operations'])}\n")
-                f.write("-" * 50 + "\n\n")
-
-
-        with open(details_file, 'w') as f:
-            f.write("Organization Details\n")
-            f.write("===================\n\n")
-            for entry in self.history:
-                f.write(f"Action: {entry['type'].replace('_', ' ').title()}\n")
-                f.write(f"Time: {datetime.fromisoformat(entry['timestamp']).strftime('%Y-%m-%d %I:%M %p')}\n")
-                f.write(f"Source: {entry['source_dir']}\n")
-                f.write(f"Target: {entry['target_dir']}\n\n")
-                if entry['type'] != 'undo':
-                    f.write("Current Folder Structure:\n")
-                    f.write("----------------------\n\n")
-                    for root, dirs, files in os.walk(entry['target_dir']):
-                        level = root.replace(entry['target_dir'], '').count(os.sep)
-                        indent = '    ' * level
-                        folder = os.path.basename(root) or os.path.basename(entry['target_dir'])
-                        f.write(f"{indent}└── 📁 {folder}/\n")
-                        for file in files:
-                            f.write(f"{indent}    ├── 📄 {file}\n")
-
-                        if files:
-                            f.write("\n") 
-                    f.write("\nFile Movements:\n")
-                    f.write("--------------\n")
-                    for op in entry['operations']:
-                        source = os.path.basename(op['source'])
-                        dest = os.path.relpath(op['destination'], entry['target_dir'])
-                        f.write(f"• {source} → {dest}\n")
-                f.write("\n" + "=" * 50 + "\n\n")
+        key = (folder, name)
+        while True:
+            counter = self._name_counters.get(key, 0) + 1
+            self._name_counters[key] = counter
+            candidate = f"{base}_{counter}{ext}"
+            if candidate not in claimed and not os.path.exists(candidate):
+                return candidate
+
+    def _scan_name_counters(self, folder: str) -> None:
+        """Record the highest numeric suffix already used for each name in folder."""
+        counters = self._name_counters
+        with os.scandir(folder) as it:
+            for entry in it:
+                base, ext = os.path.splitext(entry.name)
+                stem, sep, suffix = base.rpartition('_')
+                if sep and suffix.isdecimal():
+                    key = (folder, stem + ext)
+                    counter = int(suffix)
+                    if counter > counters.get(key, 0):
+                        counters[key] = counter
+        self._scanned_dirs.add(folder)
+
+    def _iter_tree(self, root: str, level: int = 0):
+        """Yield (level, folder name, file names) for each directory, top-down."""
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+                    else:
+                        files.append(entry.name)
+        except OSError:
+            return
+        folder = os.path.basename(os.path.normpath(root))
+        yield level, folder, files
+        for entry in subdirs:
+            yield from self._iter_tree(entry.path, level + 1)
+
+    def _format_time(self, timestamp: str) -> str:
+        """Format an ISO timestamp for the report and timeline files."""
+        from datetime import datetime
+
+        return datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %I:%M %p')
+
+    def _render_tree(self, tree: List[Tuple[int, str, List[str]]], folder_icon: str = '', file_icon: str = '') -> str:
+        """Render a folder structure collected by _iter_tree as text."""
+        parts = []
+        for level, folder, files in tree:
+            indent = '    ' * level
+            parts.append(indent + '└── ' + folder_icon + folder + '/\n')
+            files = [file for file in files if file not in _REPORT_FILES]
+            for file in files:
+                parts.append(indent + '    ├── ' + file_icon + file + '\n')
+            if files:
+                parts.append('\n')
+        return ''.join(parts)
+
+    def _build_organization_history(self, tree: List[Tuple[int, str, List[str]]]) -> Dict[str, str]:
+        """Build the current folder structure report for the history file."""
+        parts = ["Current Folder Structure\n=====================\n\n"]
+        if self.history and self.history[-1]['type'] == 'undo':
+            time = self._format_time(self.history[-1]['timestamp'])
+            parts.append(f"Files restored to original location\nTime: {time}\n")
+        else:
+            parts.append(self._render_tree(tree))
+
+        return {'organization_history.txt': ''.join(parts)}
+
+    def _build_history(self, tree: List[Tuple[int, str, List[str]]]) -> Dict[str, str]:
+        """Build the organization summary and details reports."""
+        summary = ["Organization Summary\n==================\n\n"]
+        details = ["Organization Details\n===================\n\n"]
+        for entry in self.history:
+            action = entry['type'].replace('_', ' ').title()
+            time = self._format_time(entry['timestamp'])
+            summary.append(
+                f"Action: {action}\n"
+                f"When: {time}\n"
+                f"Source: {entry['source_dir']}\n"
+                f"Target: {entry['target_dir']}\n"
+            )
+            if entry['type'] != 'undo':
+                summary.append(f"Files Organized: {len(entry['operations'])}\n")
+            summary.append("-" * 50 + "\n\n")
+
+            details.append(
+                f"Action: {action}\n"
+                f"Time: {time}\n"
+                f"Source: {entry['source_dir']}\n"
+                f"Target: {entry['target_dir']}\n\n"
+            )
+            if entry['type'] != 'undo':
+                details.append("Current Folder Structure:\n----------------------\n\n")
+                details.append(self._render_tree(tree, '📁 ', '📄 '))
+                details.append("\nFile Movements:\n--------------\n")
+                for op in entry['operations']:
+                    details.append(f"• {op['name']} → {op['relative_destination']}\n")
+            details.append("\n" + "=" * 50 + "\n\n")
+
+        return {
+            'organization_summary.txt': ''.join(summary),
+            'organization_details.txt': ''.join(details),
+        }
+
+    def _write_reports(self, target_dir: str, reports: Dict[str, str]) -> None:
+        """Write report files, skipping any whose content and on-disk state are unchanged."""
+        import hashlib
+
+        hash_file = os.path.join(target_dir, '.history_hash')
+        # Each line holds: name digest size mtime_ns
+        hashes = {}
+        if os.path.exists(hash_file):
+            with open(hash_file, 'r') as f:
+                for line in f:
+                    fields = line.rstrip('\n').rsplit(' ', 3)
+                    if len(fields) == 4:
+                        hashes[fields[0]] = tuple(fields[1:])
+
+        changed = False
+        for name, text in reports.items():
+            digest = hashlib.blake2b(text.encode('utf-8')).hexdigest()
+            report_file = os.path.join(target_dir, name)
+            stored = hashes.get(name)
+            if stored and stored[0] == digest:
+                try:
+                    stat = os.stat(report_file)
+                except FileNotFoundError:
+                    stat = None
+                # A size or mtime mismatch means the file was edited since we wrote it
+                if stat and stored[1:] == (str(stat.st_size), str(stat.st_mtime_ns)):
+                    continue
+            with open(report_file, 'w') as f:
+                f.write(text)
+            stat = os.stat(report_file)
+            hashes[name] = (digest, str(stat.st_size), str(stat.st_mtime_ns))
+            changed = True
+
+        if changed:
+            with open(hash_file, 'w') as f:
+                f.write(''.join(f"{name} {' '.join(fields)}\n" for name, fields in hashes.items()))
 
     def undo_last_operation(self) -> bool:
         """Undo last organization and cleanup empty folders."""
@@ -183,23 +365,35 @@ class FileOrganizer:
             target_dir = last_op['target_dir']
             
             # Restore files first
-            for op in tqdm(reversed(operations), desc="Restoring files"):
-                if os.path.exists(op['destination']):
-                    os.makedirs(os.path.dirname(op['source']), exist_ok=True)
-                    shutil.move(op['destination'], op['source'])
+            same_device = self._same_device(target_dir, last_op['source_dir'])
+            if same_device:
+                move = os.rename
+            else:
+                import shutil
+                move = shutil.move
+            restored_dirs = set()
+            for op in self._progress(reversed(operations), len(operations), "Restoring files"):
+                source_parent = os.path.dirname(op['source'])
+                if source_parent not in restored_dirs:
+                    os.makedirs(source_parent, exist_ok=True)
+                    restored_dirs.add(source_parent)
+                try:
+                    move(op['destination'], op['source'])
+                except FileNotFoundError:
+                    continue  # Skip files that were removed after organizing
             
-            # Clean up empty folders - walk bottom-up
-            for root, dirs, files in os.walk(target_dir, topdown=False):
-                for dir_name in dirs:
-                    dir_path = os.path.join(root, dir_name)
-                    try:
-                        # Only remove if directory is empty
-                        if not os.listdir(dir_path):
-                            os.rmdir(dir_path)
-                    except OSError:
-                        continue  # Skip if folder not empty or other error
+            # Remove the reports written for the undone organization
+            for name in _WRITTEN_REPORTS:
+                try:
+                    os.remove(os.path.join(target_dir, name))
+                except FileNotFoundError:
+                    continue
+
+            # Clean up empty folders - bottom-up
+            self._remove_empty(target_dir)
             
             # Record undo operation
+            from datetime import datetime
             undo_op = {
                 'timestamp': datetime.now().isoformat(),
                 'type': 'undo',
@@ -221,105 +415,92 @@ class FileOrganizer:
             print(f"Error during undo: {e}")
             return False
 
+    def _remove_empty(self, path: str) -> bool:
+        """Remove empty folders below path and report whether path ended up empty."""
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return False
+        empty = True
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and self._remove_empty(entry.path):
+                try:
+                    os.rmdir(entry.path)
+                    continue
+                except OSError:
+                    pass  # Skip if folder not empty or other error
+            empty = False
+        return empty
+
     def _update_timeline(self, operation: dict) -> None:
-        """Append operation to timeline file."""
-        # Read existing timeline content
-        existing_content = ""
-        if os.path.exists(self.timeline_file):
-            with open(self.timeline_file, 'r') as f:
-                existing_content = f.read()
-        
-        # If file is empty or doesn't exist, add header
-        if not existing_content:
-            existing_content = "Organization Timeline\n===================\n\n"
-        
-        # Append new operation
-        with open(self.timeline_file, 'a') as f:
-            if not existing_content.strip():
-                f.write(existing_content)
-                
-            time = datetime.fromisoformat(operation['timestamp']).strftime('%Y-%m-%d %I:%M %p')
-            if operation['type'] == 'undo':
-                f.write(f"[{time}] UNDO\n")
-                f.write(f"  └── Location: {operation['target_dir']}\n")
-                f.write("  └── Restored files to original location\n")
-            else:
-                f.write(f"[{time}] ORGANIZE\n")
-                f.write(f"  └── Method: {operation['type']}\n")
-                f.write(f"  └── Files organized: {len(operation['operations'])}\n")
-                f.write(f"  └── Location: {operation['target_dir']}\n")
-            f.write("\n")
-
-    def _write_current_structure(self, target_dir: str) -> None:
-        """Write current folder structure to details.txt."""
-        details_file = os.path.join(target_dir, 'organization_details.txt')
-        
-        with open(details_file, 'w') as f:
-            f.write("Current Folder Structure\n")
-            f.write("=====================\n\n")
-            if self.history and self.history[-1]['type'] == 'undo':
-                f.write("Files restored to original location\n")
-                f.write(f"Time: {datetime.fromisoformat(self.history[-1]['timestamp']).strftime('%Y-%m-%d %I:%M %p')}\n")
-            else:
-                for root, dirs, files in os.walk(target_dir):
-                    level = root.replace(target_dir, '').count(os.sep)
-                    indent = '    ' * level
-                    folder = os.path.basename(root) or os.path.basename(target_dir)
-                    f.write(f"{indent}└── {folder}/\n")
-                    for file in files:
-                        if file not in ['organization_details.txt', 'organization_timeline.txt']:
-                            f.write(f"{indent}    ├── {file}\n")
-                    if files:
-                        f.write('\n')
+        """Queue operation for the timeline file until the next flush."""
+        time = self._format_time(operation['timestamp'])
+        if operation['type'] == 'undo':
+            self._timeline_buffer.append(
+                f"[{time}] UNDO\n"
+                f"  └── Location: {operation['target_dir']}\n"
+                "  └── Restored files to original location\n\n"
+            )
+        else:
+            self._timeline_buffer.append(
+                f"[{time}] ORGANIZE\n"
+                f"  └── Method: {operation['type']}\n"
+                f"  └── Files organized: {len(operation['operations'])}\n"
+                f"  └── Location: {operation['target_dir']}\n\n"
+            )
 
 def main():
     """Main execution function."""
     organizer = FileOrganizer()
     
-    print("\nFile Organizer Menu:")
-    print("1. Organize by file type")
-    print("2. Organize by date")
-    print("3. Undo last organization")
+    try:
+        print("\nFile Organizer Menu:")
+        print("1. Organize by file type")
+        print("2. Organize by date")
+        print("3. Undo last organization")
     
-    choice = input("\nEnter your choice (1-3): ")
+        choice = input("\nEnter your choice (1-3): ")
     
-    if choice in ['1', '2']:
-        source_dir = input("Enter the source directory path: ").strip()
-        source_dir = os.path.expanduser(source_dir)
+        if choice in ['1', '2']:
+            source_dir = input("Enter the source directory path: ").strip()
+            source_dir = os.path.expanduser(source_dir)
         
-        print("\nWhere would you like to organize the files?")
-        print("1. Organize in the source folder")
-        print("2. Organize in a different destination folder")
-        dest_choice = input("\nEnter your choice (1-2): ").strip()
+            print("\nWhere would you like to organize the files?")
+            print("1. Organize in the source folder")
+            print("2. Organize in a different destination folder")
+            dest_choice = input("\nEnter your choice (1-2): ").strip()
         
-        dest_dir = None
-        if dest_choice == '2':
-            dest_dir = input("Enter the destination folder path: ").strip()
-            dest_dir = os.path.expanduser(dest_dir)
+            dest_dir = None
+            if dest_choice == '2':
+                dest_dir = input("Enter the destination folder path: ").strip()
+                dest_dir = os.path.expanduser(dest_dir)
         
-        try:
-            if choice == '1':
-                organizer.organize_by_type(source_dir, dest_dir)
-            else:
-                organizer.organize_by_date(source_dir, dest_dir)
+            try:
+                if choice == '1':
+                    organizer.organize_by_type(source_dir, dest_dir)
+                else:
+                    organizer.organize_by_date(source_dir, dest_dir)
             
-            target_dir = dest_dir if dest_dir else source_dir
-            print(f"\nFiles organized successfully!")
-            print(f"\nTo view the new structure:")
-            print(f"1. Open {target_dir}")
-            print(f"2. Check organization_summary.txt and organization_details.txt for complete details")
+                target_dir = dest_dir if dest_dir else source_dir
+                print(f"\nFiles organized successfully!")
+                print(f"\nTo view the new structure:")
+                print(f"1. Open {target_dir}")
+                print(f"2. Check organization_summary.txt and organization_details.txt for complete details")
             
-        except Exception as e:
-            print(f"\nAn error occurred: {e}")
+            except Exception as e:
+                print(f"\nAn error occurred: {e}")
             
-    elif choice == '3':
-        if organizer.undo_last_operation():
-            print("\nSuccessfully undid last organization!")
-            print("Files have been restored to their original locations.")
+        elif choice == '3':
+            if organizer.undo_last_operation():
+                print("\nSuccessfully undid last organization!")
+                print("Files have been restored to their original locations.")
+            else:
+                print("\nNo previous organization to undo!")
         else:
-            print("\nNo previous organization to undo!")
-    else:
-        print("\nInvalid choice! Please enter a number between 1 and 3.")
+            print("\nInvalid choice! Please enter a number between 1 and 3.")
+    finally:
+        organizer.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file